@@ -1,9 +1,33 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from solver import WordleSolver, Results, Distribution
-import concurrent.futures
+import queue
+import threading
+from operator import itemgetter
 from typing import List, Tuple, Dict, Set, Optional, Any
 
+# Most rows in a large result set are never scrolled to; keep Tk inserts bounded.
+MAX_DISPLAYED_ROWS = 1000
+
+# Rows inserted per event-loop tick when streaming results into a Treeview.
+INSERT_CHUNK = 200
+
+def _bulk_insert(tree: ttk.Treeview, rows: List[Tuple], tags: Tuple[str, ...] = ()) -> None:
+    """Append rows to a Treeview through tree.tk.call directly.
+
+    The ttk wrapper re-formats its keyword options on every insert; going
+    straight to the Tcl interpreter keeps only the unavoidable per-item
+    call, which roughly halves insertion time on large result sets.
+    """
+    call = tree.tk.call
+    w = tree._w
+    if tags:
+        for values in rows:
+            call(w, "insert", "", "end", "-values", values, "-tags", tags)
+    else:
+        for values in rows:
+            call(w, "insert", "", "end", "-values", values)
+
 # --- Constants for UI colors ---
 COLORS: Dict[str, Tuple[str, str]] = {
     "default": ("white", "black"),
@@ -12,12 +36,38 @@ COLORS: Dict[str, Tuple[str, str]] = {
     "gray": ("#808080", "white"),  # Not in word
 }
 
+# Cell state as a small int indexing _COLOR_TABLE, so the per-keystroke and
+# per-click paths use tuple indexing instead of dict hashing on state names.
+_STATE_NAMES = ("default", "gray", "yellow", "green")
+_STATE_IDX = {name: i for i, name in enumerate(_STATE_NAMES)}
+_COLOR_TABLE = tuple(COLORS[name] for name in _STATE_NAMES)
+# Click cycle for filled cells: gray -> yellow -> green -> gray ("default" stays put).
+_NEXT_IDX = (0, 2, 3, 1)
+
 class WordleUI:
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
         self.solver = WordleSolver()
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self.letter_cells: List['LetterCell'] = []
+        self._all_cells: List['LetterCell'] = []  # pool backing letter_cells
+        # Parsed mirror of word_length_var so hot keystroke paths read an
+        # attribute instead of doing a Tcl get() plus int() each time.
+        self._word_length = 5
+        self._rebuild_after_id: Optional[str] = None
+        # Constraint tuple of the last submitted filter; identical resubmits
+        # are dropped before the trees are even cleared.
+        self._last_key: Optional[Tuple[int, str, str, str, int]] = None
+        # Bumped whenever the trees are cleared, so in-flight chunked
+        # inserts from a superseded filter stop scheduling themselves.
+        self._ui_generation = 0
+        # One persistent worker thread fed by a queue; stale jobs are
+        # coalesced so bursty clicks only run the newest filter.
+        self._jobs: "queue.Queue[tuple]" = queue.Queue()
+        threading.Thread(target=self._worker, daemon=True).start()
+        # Memo of complete filter runs keyed by the normalized constraint
+        # tuple, so toggling a cell back to a previous state is a dict hit
+        # instead of a full dictionary scan.
+        self._filter_cache: Dict[Tuple[int, str, str, str, int], Tuple[Results, List[Tuple[str, float]], Distribution, List[Tuple[str, int]], str]] = {}
 
         self.setup_ui()
 
@@ -38,13 +88,22 @@ class WordleUI:
         tk.Label(left_frame, text="Word Length:").grid(row=0, column=0, sticky=tk.W, pady=2)
         self.word_length_var = tk.StringVar(value="5")
         self.word_length_var.trace_add("write", self.on_word_length_change)
-        word_length_entry = ttk.Entry(left_frame, width=10, textvariable=self.word_length_var)
+        # Let Tk reject non-digit keystrokes up front so the trace callback
+        # never has to catch ValueError on partial input.
+        vcmd = (self.root.register(lambda s: s.isdigit() or s == ""), "%P")
+        word_length_entry = ttk.Entry(
+            left_frame, width=10, textvariable=self.word_length_var,
+            validate="key", validatecommand=vcmd,
+        )
         word_length_entry.grid(row=0, column=1, pady=2)
 
         # --- Input Grid ---
         tk.Label(left_frame, text="Pattern:").grid(row=1, column=0, sticky=tk.W, pady=2)
         self.grid_frame = ttk.Frame(left_frame)
         self.grid_frame.grid(row=1, column=1, pady=2, sticky=tk.W)
+        # One class-level binding shared by every cell entry, instead of a
+        # per-widget bind table entry for each of the 30+ cells.
+        self.root.bind_class("WordleCell", "<KeyRelease>", self._on_cell_key_release)
         self.rebuild_grid(5)
 
         # --- Not Allowed Letters ---
@@ -106,34 +165,46 @@ class WordleUI:
         return tree
 
     def on_word_length_change(self, *args: Any) -> None:
-        try:
-            length = int(self.word_length_var.get())
-            if length > 0:
-                self.rebuild_grid(length)
-        except ValueError:
-            pass # Ignore non-integer input
+        # Debounce: typing "10" fires the trace for "1" and then "10";
+        # coalesce rapid edits so only the final value rebuilds the grid.
+        if self._rebuild_after_id is not None:
+            self.root.after_cancel(self._rebuild_after_id)
+        self._rebuild_after_id = self.root.after(300, self._do_rebuild)
+
+    def _do_rebuild(self) -> None:
+        self._rebuild_after_id = None
+        # The entry is validated to digits, so "" is the only non-int value.
+        length = int(self.word_length_var.get() or "0")
+        if length > 0 and length != self._word_length:
+            self._word_length = length
+            self.rebuild_grid(length)
 
     def rebuild_grid(self, word_length: int, rows: int = 6) -> None:
-        for widget in self.grid_frame.winfo_children():
-            widget.destroy()
-        self.letter_cells.clear()
-
-        for r in range(rows):
-            row_frame = tk.Frame(self.grid_frame)
-            row_frame.pack(side="top", pady=2)
-            for c in range(word_length):
-                cell = LetterCell(row_frame, app=self)
-                cell.pack(side="left", padx=2)
-                self.letter_cells.append(cell)
+        # Cells are pooled: a resize re-grids (and resets) existing widgets
+        # and only allocates the delta, since creating a Tk Entry is far
+        # more expensive than moving one.
+        needed = rows * word_length
+        while len(self._all_cells) < needed:
+            self._all_cells.append(
+                LetterCell(self.grid_frame, app=self, index=len(self._all_cells))
+            )
+
+        for i, cell in enumerate(self._all_cells):
+            if i < needed:
+                cell.reset()
+                cell.grid(row=i // word_length, column=i % word_length, padx=2, pady=2)
+            else:
+                cell.grid_remove()
+
+        self.letter_cells = self._all_cells[:needed]
 
     def reset_all(self) -> None:
         for cell in self.letter_cells:
             cell.reset()
         self.not_allowed_entry.delete(0, tk.END)
         self.status_text.set("")
-        for tree in [self.output_tree, self.letter_tree, self.best_guesses_tree, self.remaining_words_tree]:
-            for item in tree.get_children():
-                tree.delete(item)
+        self._last_key = None
+        self.reset_results()
 
     def apply_filter(self) -> None:
         try:
@@ -142,12 +213,24 @@ class WordleUI:
             messagebox.showerror("Input Error", "Word Length must be an integer.")
             return
 
+        # Read the StringVar here: Tk variables must only be touched from
+        # the main thread, and this saves re-parsing it in update_ui.
+        try:
+            min_freq = int(self.min_freq_var.get())
+        except ValueError:
+            messagebox.showerror("Input Error", "Minimum Frequency must be an integer.")
+            return
+
         pattern_list: List[str] = ["_"] * word_length
         not_allowed_letters: Set[str] = set(self.not_allowed_entry.get().strip().lower())
         misplaced_map: Dict[str, Set[int]] = {}
+        used_letters: Set[str] = set()
 
-        for i, cell in enumerate(self.letter_cells):
-            letter, state = cell.get_state()
+        # One pass over the cell states: place greens, collect yellows, ban
+        # grays, and accumulate used_letters inline rather than re-deriving
+        # it from the pattern and misplaced map afterwards.
+        cell_states = [cell.get_state() for cell in self.letter_cells]
+        for i, (letter, state) in enumerate(cell_states):
             pos_1_based = (i % word_length) + 1
 
             if not letter or state == "default":
@@ -158,10 +241,12 @@ class WordleUI:
                     messagebox.showerror("Input Error", f"Contradiction at position {pos_1_based}.")
                     return
                 pattern_list[pos_1_based - 1] = letter
+                used_letters.add(letter)
             elif state == "yellow":
                 if letter not in misplaced_map:
                     misplaced_map[letter] = set()
                 misplaced_map[letter].add(pos_1_based)
+                used_letters.add(letter)
             elif state == "gray":
                 not_allowed_letters.add(letter)
 
@@ -176,92 +261,180 @@ class WordleUI:
             for letter, positions in misplaced_map.items()
         )
 
+        key = (word_length, pattern_input, not_allowed_input, misplaced_input, min_freq)
+        if key == self._last_key:
+            return
+        self._last_key = key
+
         self.filter_button.config(state=tk.DISABLED)
         self.status_text.set("Filtering...")
         self.reset_results()
 
-        future = self.executor.submit(
-            self.run_full_filter,
+        self._jobs.put((
             word_length,
             pattern_input,
             not_allowed_input,
             misplaced_input,
-            {l for l, s in misplaced_map.items()} | {p for p in pattern_list if p != "_"},
+            min_freq,
+            used_letters,
             not_allowed_letters
-        )
-        future.add_done_callback(self.on_filter_complete)
+        ))
 
-    def run_full_filter(self, word_length: int, pattern: str, not_allowed: str, misplaced_input: str, used_letters: Set[str], not_allowed_letters: Set[str]) -> Tuple[Results, Set[str], Set[str], int, List[Tuple[str, float]], Distribution]:
-        min_freq = int(self.min_freq_var.get())
-        filtered_results = self.solver.filter_words(
-            word_length, pattern, not_allowed, misplaced_input
+    def run_full_filter(self, word_length: int, pattern: str, not_allowed: str, misplaced_input: str, min_freq: int, used_letters: Set[str], not_allowed_letters: Set[str]) -> Tuple[Results, List[Tuple[str, float]], List[Tuple[str, int]], List[Tuple[str, int]]]:
+        cache_key = (word_length, pattern, not_allowed, misplaced_input, min_freq)
+        cached = self._filter_cache.get(cache_key)
+        if cached is not None:
+            filtered_results, best_guess_list, overall_distribution, sorted_letter_dist, payload = cached
+        else:
+            filtered_results = self.solver.filter_words(
+                word_length, pattern, not_allowed, misplaced_input
+            )
+            payload = "".join([f"{word},{freq}\n" for word, freq in filtered_results])
+            overall_distribution, _ = self.solver.compute_letter_distributions(filtered_results)
+            best_guess_list = self.solver.best_guesses(filtered_results, overall_distribution, min_frequency=min_freq)
+            # Sort here so the Tk thread only has to insert the rows.
+            sorted_letter_dist = sorted(overall_distribution.items(), key=itemgetter(1), reverse=True)
+
+            if len(self._filter_cache) >= 32:
+                self._filter_cache.clear()
+            self._filter_cache[cache_key] = (filtered_results, best_guess_list, overall_distribution, sorted_letter_dist, payload)
+
+        # Rewrite the file on cache hits too, so it always matches what the
+        # UI shows; the write is cheap next to the filtering pipeline and we
+        # are on the worker thread, so the Tk loop never blocks on disk I/O.
+        self._write_results(payload)
+
+        # The remaining-letters search depends on the cell colors as well as
+        # the constraint tuple, so it runs outside the cache — but still on
+        # this thread, keeping the Tk event loop to pure rendering.
+        remaining_words = self.solver.find_words_from_remaining_letters(
+            used_letters, not_allowed_letters, overall_distribution, word_length, min_freq
         )
-        overall_distribution, _ = self.solver.compute_letter_distributions(filtered_results)
-        best_guess_list = self.solver.best_guesses(filtered_results, overall_distribution, min_frequency=min_freq)
-        
-        return filtered_results, used_letters, not_allowed_letters, word_length, best_guess_list, overall_distribution
-
-    def on_filter_complete(self, future: concurrent.futures.Future) -> None:
-        try:
-            results, used_letters, not_allowed_letters, word_length, best_guess_list, overall_distribution = future.result()
-        except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", f"An error occurred: {e}"))
-            self.root.after(0, lambda: self.filter_button.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.status_text.set("Error during filtering"))
-            return
+        return filtered_results, best_guess_list, sorted_letter_dist, remaining_words
 
-        self.root.after(0, self.update_ui, results, best_guess_list, overall_distribution, used_letters, not_allowed_letters, word_length)
-
-    def update_ui(self, results: Results, best_guess_list: List[Tuple[str, float]], overall_distribution: Distribution, used_letters: Set[str], not_allowed_letters: Set[str], word_length: int) -> None:
+    def _write_results(self, payload: str) -> None:
         try:
             with open("sorted_filtered_words.txt", "w") as outfile:
-                for word, freq in results:
-                    outfile.write(f"{word},{freq}\n")
+                outfile.write(payload)
         except Exception as e:
-            messagebox.showerror("File Error", f"An error occurred while writing the output file: {e}")
+            self.root.after(0, lambda e=e: messagebox.showerror(
+                "File Error", f"An error occurred while writing the output file: {e}"
+            ))
+
+    def _worker(self) -> None:
+        while True:
+            job = self._jobs.get()
+            # Drop all but the newest pending job: only the latest set of
+            # constraints is worth computing during rapid re-submits.
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                results, best_guess_list, sorted_letter_dist, remaining_words = self.run_full_filter(*job)
+            except Exception as e:
+                self._last_key = None  # let the user retry the same inputs
+                self.root.after(0, lambda e=e: messagebox.showerror("Error", f"An error occurred: {e}"))
+                self.root.after(0, lambda: self.filter_button.config(state=tk.NORMAL))
+                self.root.after(0, lambda: self.status_text.set("Error during filtering"))
+                continue
+
+            self.root.after(0, self.update_ui, results, best_guess_list, sorted_letter_dist, remaining_words)
 
+    def update_ui(self, results: Results, best_guess_list: List[Tuple[str, float]], sorted_letter_dist: List[Tuple[str, int]], remaining_words: List[Tuple[str, int]]) -> None:
         self.status_text.set(f"Found {len(results)} words. Results saved to sorted_filtered_words.txt")
 
-        for word, frequency in results:
-            self.output_tree.insert("", tk.END, values=(word, frequency))
+        output_rows: List[Tuple] = list(results[:MAX_DISPLAYED_ROWS])
+        if len(results) > MAX_DISPLAYED_ROWS:
+            output_rows.append((f"... and {len(results) - MAX_DISPLAYED_ROWS} more", ""))
+        self._drain(self.output_tree, output_rows, 0, self._ui_generation)
 
-        for letter, freq in sorted(overall_distribution.items(), key=lambda x: x[1], reverse=True):
-            self.letter_tree.insert("", tk.END, values=(letter, freq))
+        _bulk_insert(self.letter_tree, sorted_letter_dist)
 
-        possible_answers = {word for word, _ in results}
+        possible_answers = frozenset(map(itemgetter(0), results))
+        guess_call = self.best_guesses_tree.tk.call
+        guess_w = self.best_guesses_tree._w
+        tag_possible, tag_probe = ("possible",), ("probe",)
         for word, score in best_guess_list:
-            tag = "possible" if word in possible_answers else "probe"
-            self.best_guesses_tree.insert("", tk.END, values=(word, f"{score:.2f}"), tags=(tag,))
+            tags = tag_possible if word in possible_answers else tag_probe
+            guess_call(guess_w, "insert", "", "end", "-values", (word, f"{score:.2f}"), "-tags", tags)
 
-        try:
-            min_freq = int(self.min_freq_var.get())
-        except ValueError:
-            min_freq = 0
-            
-        remaining_words = self.solver.find_words_from_remaining_letters(
-            used_letters, not_allowed_letters, overall_distribution, word_length, min_freq
-        )
-        for word, score in remaining_words:
-            self.remaining_words_tree.insert("", tk.END, values=(word, score))
+        remaining_rows: List[Tuple] = list(remaining_words[:MAX_DISPLAYED_ROWS])
+        if len(remaining_words) > MAX_DISPLAYED_ROWS:
+            remaining_rows.append((f"... and {len(remaining_words) - MAX_DISPLAYED_ROWS} more", ""))
+        self._drain(self.remaining_words_tree, remaining_rows, 0, self._ui_generation)
 
         self.filter_button.config(state=tk.NORMAL)
 
+    def _on_cell_key_release(self, event: tk.Event) -> None:
+        cell: 'LetterCell' = event.widget.master
+
+        # Set initial color to gray if a letter is typed, or back to default if empty
+        if cell.char_var.get() and cell._state_idx == 0:
+            cell._set_state(1)  # gray
+        elif not cell.char_var.get():
+            cell._set_state(0)  # default
+
+        # Move focus based on key press
+        if event.keysym == "Left":
+            prev_widget = cell.tk_focusPrev()
+            if prev_widget:
+                prev_widget.focus_set()
+        elif event.keysym == "Right":
+            next_widget = cell.tk_focusNext()
+            if next_widget:
+                next_widget.focus_set()
+        elif event.keysym == "Up":
+            # Manually navigate up
+            up_index = cell.index - self._word_length
+            if up_index >= 0:
+                self.letter_cells[up_index].entry.focus_set()
+        elif event.keysym == "Down":
+            # Manually navigate down
+            down_index = cell.index + self._word_length
+            if down_index < len(self.letter_cells):
+                self.letter_cells[down_index].entry.focus_set()
+        # Auto-tab to next cell only on character entry
+        elif cell.char_var.get() and event.keysym not in ["BackSpace", "Delete", "Tab", "Shift_L", "Shift_R"]:
+            next_widget = cell.tk_focusNext()
+            if next_widget:
+                next_widget.focus_set()
+
+    def _drain(self, tree: ttk.Treeview, rows: List[Tuple], start: int, gen: int) -> None:
+        """Insert rows in INSERT_CHUNK slices, one event-loop tick apart.
+
+        Large result sets stream in while the user can still scroll and
+        type; a generation bump (tree cleared) cancels the remainder.
+        """
+        if gen != self._ui_generation:
+            return
+        end = start + INSERT_CHUNK
+        _bulk_insert(tree, rows[start:end])
+        if end < len(rows):
+            self.root.after_idle(self._drain, tree, rows, end, gen)
+
     def reset_results(self) -> None:
-        for tree in [self.output_tree, self.letter_tree, self.best_guesses_tree, self.remaining_words_tree]:
-            for item in tree.get_children():
-                tree.delete(item)
+        self._ui_generation += 1
+        # delete() is variadic: drop each tree's rows in one Tcl call.
+        for tree in (self.output_tree, self.letter_tree, self.best_guesses_tree, self.remaining_words_tree):
+            kids = tree.get_children()
+            if kids:
+                tree.delete(*kids)
 
 
 
 # --- LetterCell Class for the input grid ---
 class LetterCell(tk.Frame):
-    def __init__(self, master: tk.Widget, width: int = 40, height: int = 40, app: Optional['WordleUI'] = None) -> None:
+    def __init__(self, master: tk.Widget, width: int = 40, height: int = 40, app: Optional['WordleUI'] = None, index: int = 0) -> None:
         super().__init__(master, width=width, height=height, borderwidth=1, relief="solid")
         self.pack_propagate(False)
         self.app = app
+        self.index = index  # position in app.letter_cells, fixed at build time
 
         self.char_var = tk.StringVar()
-        self._trace_id = self.char_var.trace_add("write", self._on_text_change)
+        self._updating = False
+        self.char_var.trace_add("write", self._on_text_change)
 
         self.entry = tk.Entry(
             self,
@@ -277,11 +450,17 @@ class LetterCell(tk.Frame):
         )
         self.entry.pack(expand=True, fill="both")
 
-        self.color_state: str = "default"
-        self.entry.bind("<KeyRelease>", self.on_key_release)
+        self._state_idx: int = 0  # index into _STATE_NAMES / _COLOR_TABLE
+        # Key handling is shared: route this entry through the app-wide
+        # "WordleCell" class binding rather than a per-instance bind.
+        self.entry.bindtags(("WordleCell",) + self.entry.bindtags())
         self.entry.bind("<Button-1>", self.on_click)
 
     def _on_text_change(self, *args: Any) -> None:
+        # Re-entrancy guard: normalizing below re-fires this trace, and a
+        # flag check is far cheaper than removing and re-adding the trace.
+        if self._updating:
+            return
         text = self.char_var.get()
         new_text = ""
         if text:
@@ -289,75 +468,35 @@ class LetterCell(tk.Frame):
             if char.isalpha():
                 new_text = char.upper()
 
-        if self.char_var.get() != new_text:
-            self.char_var.trace_vdelete("w", self._trace_id)
+        if text != new_text:
+            self._updating = True
             self.char_var.set(new_text)
             self.entry.icursor(tk.END)
-            self._trace_id = self.char_var.trace_add("write", self._on_text_change)
-
-    def on_key_release(self, event: tk.Event) -> None:
-        # Set initial color to gray if a letter is typed, or back to default if empty
-        if self.char_var.get() and self.color_state == "default":
-            self.set_color("gray")
-        elif not self.char_var.get():
-            self.set_color("default")
-
-        if not self.app:
-            return
-
-        # Move focus based on key press
-        if event.keysym == "Left":
-            prev_widget = self.tk_focusPrev()
-            if prev_widget:
-                prev_widget.focus_set()
-        elif event.keysym == "Right":
-            next_widget = self.tk_focusNext()
-            if next_widget:
-                next_widget.focus_set()
-        elif event.keysym == "Up":
-            # Manually navigate up
-            current_index = self.app.letter_cells.index(self)
-            word_length = int(self.app.word_length_var.get())
-            up_index = current_index - word_length
-            if up_index >= 0:
-                self.app.letter_cells[up_index].entry.focus_set()
-        elif event.keysym == "Down":
-            # Manually navigate down
-            current_index = self.app.letter_cells.index(self)
-            word_length = int(self.app.word_length_var.get())
-            down_index = current_index + word_length
-            if down_index < len(self.app.letter_cells):
-                self.app.letter_cells[down_index].entry.focus_set()
-        # Auto-tab to next cell only on character entry
-        elif self.char_var.get() and event.keysym not in ["BackSpace", "Delete", "Tab", "Shift_L", "Shift_R"]:
-            next_widget = self.tk_focusNext()
-            if next_widget:
-                next_widget.focus_set()
+            self._updating = False
 
     def on_click(self, event: tk.Event) -> None:
-        # Cycle through colors on click: Gray -> Yellow -> Green -> Gray
-        if self.color_state == "gray":
-            self.set_color("yellow")
-        elif self.color_state == "yellow":
-            self.set_color("green")
-        elif self.color_state == "green":
-            self.set_color("gray")
-        # Do nothing if state is "default" (cell is empty)
+        # Index 0 ("default", empty cell) cycles to itself, so clicks there
+        # would be a no-op config; skip them entirely.
+        if self._state_idx:
+            self._set_state(_NEXT_IDX[self._state_idx])
+
+    def _set_state(self, idx: int) -> None:
+        self._state_idx = idx
+        bg, fg = _COLOR_TABLE[idx]
+        self.entry.config(bg=bg, fg=fg, insertbackground=fg)
 
     def set_color(self, color_name: str) -> None:
-        self.color_state = color_name
-        bg, fg = COLORS[color_name]
-        self.entry.config(bg=bg, fg=fg, insertbackground=fg)
+        self._set_state(_STATE_IDX[color_name])
 
     def get_letter(self) -> str:
         return self.char_var.get().lower()
 
     def get_state(self) -> Tuple[str, str]:
-        return self.get_letter(), self.color_state
+        return self.get_letter(), _STATE_NAMES[self._state_idx]
 
     def reset(self) -> None:
         self.char_var.set("")
-        self.set_color("default")
+        self._set_state(0)
 
 if __name__ == "__main__":
     root = tk.Tk()
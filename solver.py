@@ -1,14 +1,33 @@
 import os
-import math
-from collections import Counter
+import re
+import zipfile
+from operator import itemgetter
 from typing import List, Dict, Tuple, Set, Optional, Any
 
-WordData = Dict[str, Any]  # {"word": str, "freq": int, "mask": int}
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy paths are used without it
+    njit = None
+    prange = range
+
+LengthTable = Dict[str, Any]  # {"words": List[str], "codes", "freqs", "masks": np.ndarray}
 Results = List[Tuple[str, int]]
 Distribution = Dict[str, int]
 PositionalDistribution = Dict[int, Distribution]
 MisplacedDict = Dict[str, Set[int]]
 
+# Largest entropy pool for which the pool-vs-pool pattern matrix is materialized
+_MATRIX_POOL_LIMIT = 2048
+
+# Bump when the cached .npz layout changes so stale caches are rebuilt
+_CACHE_VERSION = 1
+
+# "letter: positions" entries of the misplaced-letters input, compiled once
+# at import since the parse runs on every filter
+_MISPLACED_RE = re.compile(r"([A-Za-z])\s*:\s*([^;]*)")
+
 class WordleSolver:
     """
     Encapsulates the logic for loading, filtering, and suggesting words for a Wordle-like game.
@@ -17,7 +36,17 @@ class WordleSolver:
         """
         Initializes the solver by loading and pre-processing the word list.
         """
-        self.word_data_list: List[WordData] = self._load_word_list(word_list_path)
+        self.by_length: Dict[int, LengthTable] = {}
+        self._load_word_list(word_list_path)
+        # Coverage scores keyed by (length, min frequency, distribution items);
+        # successive filters often reuse an identical distribution.
+        self._coverage_cache: Dict[Any, Tuple[int, List[Tuple[str, float]]]] = {}
+        # Pool-vs-pool pattern-id matrices keyed by the pool itself.
+        self._matrix_cache: Dict[Any, np.ndarray] = {}
+        # Parsed constraint state keyed by the raw filter input strings.
+        self._constraint_cache: Dict[Tuple[str, str, str], Tuple[int, int, list, np.ndarray, np.ndarray]] = {}
+        # Finished best_guesses results keyed by the (small) survivor pool.
+        self._best_cache: Dict[Any, List[Tuple[str, float]]] = {}
 
     # --- Private Helper Methods ---
     def _get_char_mask(self, char: str) -> int:
@@ -31,30 +60,118 @@ class WordleSolver:
             mask |= 1 << (ord(char) - ord('a'))
         return mask
 
-    def _load_word_list(self, filename: str) -> List[WordData]:
+    def _load_word_list(self, filename: str) -> None:
         """
-        Loads word data from the given file once and returns the list.
-        Each entry is a dictionary containing the word, its frequency, and a pre-computed bitmask.
+        Populates the per-length tables from the given file, going through a
+        binary .npz cache next to it when the cache is up to date. Each table
+        holds parallel word/code/frequency/mask arrays sorted by descending
+        frequency.
         """
-        data: List[WordData] = []
         filepath = os.path.join(os.path.dirname(__file__), filename)
-        with open(filepath, encoding="utf-8") as f:
-            for line in f:
-                parts = line.strip().split(",")
-                if len(parts) != 2:
-                    continue
-                word, freq_str = parts[0].strip(), parts[1].strip()
-                try:
-                    frequency = int(freq_str)
-                except ValueError:
-                    continue
-                
-                data.append({
-                    "word": word,
-                    "freq": frequency,
-                    "mask": self._get_word_mask(word),
-                })
-        return data
+        cache_path = os.path.splitext(filepath)[0] + ".npz"
+        stat = os.stat(filepath)
+        meta = np.array([_CACHE_VERSION, stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+
+        if self._load_cache(cache_path, meta):
+            return
+
+        with open(filepath, "rb") as f:
+            raw = f.read()
+
+        # Bulk-vectorized parse for the clean "word,count" layout; it builds
+        # the sorted code arrays directly without per-line Python work.
+        parsed = _parse_word_list_bytes(raw)
+        if parsed is not None:
+            for length, (words, codes, freqs) in parsed.items():
+                self.by_length[length] = {
+                    "words": words,
+                    "codes": codes,
+                    "freqs": freqs,
+                    # Unique-letter bitmasks, derived from the codes in one pass
+                    "masks": np.bitwise_or.reduce(np.uint32(1) << codes.astype(np.uint32), axis=1),
+                }
+            self._save_cache(cache_path, meta)
+            return
+
+        # Tolerant line-by-line fallback for files with irregular lines
+        words_by_len: Dict[int, List[str]] = {}
+        freqs_by_len: Dict[int, List[int]] = {}
+        for line in raw.decode("utf-8").splitlines():
+            parts = line.strip().split(",")
+            if len(parts) != 2:
+                continue
+            # Normalize case once here so no hot path has to lower() again
+            word, freq_str = parts[0].strip().lower(), parts[1].strip()
+            try:
+                frequency = int(freq_str)
+            except ValueError:
+                continue
+
+            length = len(word)
+            words_by_len.setdefault(length, []).append(word)
+            freqs_by_len.setdefault(length, []).append(frequency)
+
+        for length, words in words_by_len.items():
+            freq_list = freqs_by_len[length]
+            order = sorted(range(len(words)), key=freq_list.__getitem__, reverse=True)
+            sorted_words = [words[i] for i in order]
+            codes = encode_words(sorted_words, length)
+            self.by_length[length] = {
+                "words": sorted_words,
+                "codes": codes,
+                "freqs": np.fromiter((freq_list[i] for i in order), np.int64, count=len(order)),
+                # Unique-letter bitmasks, derived from the codes in one pass
+                "masks": np.bitwise_or.reduce(np.uint32(1) << codes.astype(np.uint32), axis=1),
+            }
+
+        self._save_cache(cache_path, meta)
+
+    def _load_cache(self, cache_path: str, meta: np.ndarray) -> bool:
+        """Restores the tables from the .npz cache; False if absent or stale."""
+        try:
+            with np.load(cache_path) as cache:
+                if "meta" not in cache.files or not np.array_equal(cache["meta"], meta):
+                    return False
+                for length in cache["lengths"]:
+                    length = int(length)
+                    self.by_length[length] = {
+                        "words": cache[f"words_{length}"].astype(str).tolist(),
+                        "codes": cache[f"codes_{length}"],
+                        "freqs": cache[f"freqs_{length}"],
+                        "masks": cache[f"masks_{length}"],
+                    }
+            return True
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            # A corrupt or half-written cache must never block startup;
+            # fall through to reparsing the text file.
+            self.by_length.clear()
+            return False
+
+    def _save_cache(self, cache_path: str, meta: np.ndarray) -> None:
+        """Writes the tables to the .npz cache; failures are non-fatal."""
+        arrays: Dict[str, np.ndarray] = {
+            "meta": meta,
+            "lengths": np.array(sorted(self.by_length), dtype=np.int64),
+        }
+        for length, table in self.by_length.items():
+            # Byte strings come straight out of the code arrays
+            buf = (table["codes"] + np.uint8(ord('a'))).tobytes()
+            arrays[f"words_{length}"] = np.frombuffer(buf, dtype=f"S{length}")
+            arrays[f"codes_{length}"] = table["codes"]
+            arrays[f"freqs_{length}"] = table["freqs"]
+            arrays[f"masks_{length}"] = table["masks"]
+        # Write to a sibling temp file and rename, so a crash mid-write
+        # cannot leave a truncated cache at the real path.
+        tmp_path = cache_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
     def parse_misplaced_letters(self, s: str) -> MisplacedDict:
         """
@@ -64,81 +181,94 @@ class WordleSolver:
         where it must NOT appear, but must appear somewhere else.
         """
         misplaced: MisplacedDict = {}
-        if not s.strip():
-            return misplaced
-
-        entries = s.split(";")
-        for entry in entries:
-            if ":" in entry:
-                letter_part, pos_part = entry.split(":")
-                letter = letter_part.strip().lower()
-                # Collect positions (convert from 1-based to 0-based)
-                positions = {
-                    int(p.strip()) - 1
-                    for p in pos_part.split(",")
-                    if p.strip().isdigit()
-                }
-                if letter in misplaced:
-                    misplaced[letter].update(positions)
-                else:
-                    misplaced[letter] = positions
+        for letter, pos_part in _MISPLACED_RE.findall(s):
+            letter = letter.lower()
+            # Collect positions (convert from 1-based to 0-based)
+            positions = {
+                int(p) - 1
+                for p in pos_part.split(",")
+                if p.strip().isdigit()
+            }
+            if letter in misplaced:
+                misplaced[letter].update(positions)
+            else:
+                misplaced[letter] = positions
 
         return misplaced
 
-    def _filter_word_with_mask(self, word_data: WordData, word_length: Optional[int], pattern: str, not_allowed_mask: int, misplaced_dict: MisplacedDict) -> bool:
+    def _filter_table(self, table: LengthTable, fixed_idx: np.ndarray, fixed_codes: np.ndarray, not_allowed_mask: int, required_mask: int, misplaced_positions: List[Tuple[int, Set[int]]]) -> Results:
         """
-        Returns True if the word from `word_data` satisfies all constraints.
-        Uses pre-computed bitmasks for faster filtering.
+        Applies all constraints to one per-length table with vectorized
+        boolean reductions and returns the surviving (word, frequency) tuples
+        in the table's descending-frequency order.
         """
-        word: str = word_data["word"]
-        word_mask: int = word_data["mask"]
+        codes: np.ndarray = table["codes"]
+        masks: np.ndarray = table["masks"]
+        length = codes.shape[1]
 
-        # 1) Length check
-        if word_length is not None and len(word) != word_length:
-            return False
+        # 1) Excluded letters
+        keep = (masks & np.uint32(not_allowed_mask)) == 0
 
-        # 2) Excluded letters (fast check)
-        if word_mask & not_allowed_mask:
-            return False
+        # 2) All misplaced letters must be present: one combined mask test
+        if required_mask:
+            keep &= (masks & np.uint32(required_mask)) == np.uint32(required_mask)
 
-        # 3) Pattern check
-        lower = word.lower()
-        for i, p_char in enumerate(pattern):
-            if p_char != "_" and lower[i] != p_char.lower():
-                return False
-
-        # 4) Misplaced letters check
-        for letter, bad_positions in misplaced_dict.items():
-            # Check if letter is present in the word (fast)
-            if not (word_mask & self._get_char_mask(letter)):
-                return False
-            # Check if it's in a bad spot (slower)
+        # 3) Pattern: one block compare over all fixed positions at once
+        if fixed_idx.size:
+            if fixed_idx[-1] >= length:
+                return []
+            keep &= (codes[:, fixed_idx] == fixed_codes).all(axis=1)
+
+        # 4) Misplaced letters must not sit at their bad positions
+        for code, bad_positions in misplaced_positions:
             for pos in bad_positions:
-                if 0 <= pos < len(lower) and lower[pos] == letter:
-                    return False
+                if 0 <= pos < length:
+                    keep &= codes[:, pos] != code
 
-        return True
+        words: List[str] = table["words"]
+        freqs: np.ndarray = table["freqs"]
+        return [(words[i], int(freqs[i])) for i in np.nonzero(keep)[0]]
 
     def filter_words(self, word_length: Optional[int], pattern: str, not_allowed: str, misplaced_input: str) -> Results:
         """
         Returns a list of (word, frequency) tuples matching the given constraints.
         """
-        # 1) Pre-compute masks for constraints
-        not_allowed_mask = self._get_word_mask(not_allowed)
-        misplaced_dict = self.parse_misplaced_letters(misplaced_input)
-
-        # 2) Filter entirely in memory
-        results_data = [
-            wd
-            for wd in self.word_data_list
-            if self._filter_word_with_mask(wd, word_length, pattern, not_allowed_mask, misplaced_dict)
-        ]
-
-        # Convert back to (word, frequency) tuples
-        results: Results = [(d["word"], d["freq"]) for d in results_data]
-
-        # 3) Sort by descending frequency
-        results.sort(key=lambda x: x[1], reverse=True)
+        # 1) Pre-compute all constraint state once per call, not per table/word.
+        # Memoized on the raw input strings: the GUI resubmits identical
+        # constraint strings across clicks and near-identical toggles.
+        state_key = (pattern, not_allowed, misplaced_input)
+        state = self._constraint_cache.get(state_key)
+        if state is None:
+            not_allowed_mask = self._get_word_mask(not_allowed)
+            misplaced_dict = self.parse_misplaced_letters(misplaced_input)
+            required_mask = 0
+            misplaced_positions: List[Tuple[int, Set[int]]] = []
+            for letter, bad_positions in misplaced_dict.items():
+                required_mask |= self._get_char_mask(letter)
+                misplaced_positions.append((ord(letter) - ord('a'), bad_positions))
+            # The pattern is encoded in one shot instead of char by char
+            pat_codes = np.frombuffer(pattern.lower().encode("ascii"), dtype=np.uint8)
+            fixed_idx = np.nonzero(pat_codes != ord('_'))[0]
+            fixed_codes = pat_codes[fixed_idx] - ord('a')
+            if len(self._constraint_cache) >= 128:
+                self._constraint_cache.clear()
+            state = (not_allowed_mask, required_mask, misplaced_positions, fixed_idx, fixed_codes)
+            self._constraint_cache[state_key] = state
+        not_allowed_mask, required_mask, misplaced_positions, fixed_idx, fixed_codes = state
+
+        # 2) Filter only the matching length bucket (or all of them)
+        if word_length is not None:
+            table = self.by_length.get(word_length)
+            if table is None:
+                return []
+            return self._filter_table(table, fixed_idx, fixed_codes, not_allowed_mask, required_mask, misplaced_positions)
+
+        results: Results = []
+        for table in self.by_length.values():
+            results.extend(self._filter_table(table, fixed_idx, fixed_codes, not_allowed_mask, required_mask, misplaced_positions))
+
+        # 3) Re-sort by descending frequency across the length buckets
+        results.sort(key=itemgetter(1), reverse=True)
         return results
 
     def compute_letter_distributions(self, results: Results) -> Tuple[Distribution, PositionalDistribution]:
@@ -156,14 +286,26 @@ class WordleSolver:
 
         # assume all words same length
         length = len(results[0][0])
+        codes = encode_words([w for w, _ in results], length)
+        freqs = np.fromiter((f for _, f in results), np.float64, count=len(results))
+
+        # One weighted bincount over position-offset codes (code + 26*pos)
+        # yields every positional histogram in a single C pass; the overall
+        # counts are their sum.
+        offsets = codes + (np.arange(length, dtype=np.intp) * 26)[None, :]
+        per_position = np.bincount(
+            offsets.ravel(), weights=np.repeat(freqs, length), minlength=26 * length
+        ).reshape(length, 26)
+        overall_counts = per_position.sum(axis=0)
+
+        for code in np.unique(codes):
+            overall[chr(ord('a') + code)] = int(overall_counts[code])
         for pos in range(length):
-            positional[pos] = {}
-
-        for word, freq in results:
-            lw = word.lower()
-            for i, ch in enumerate(lw):
-                overall[ch] = overall.get(ch, 0) + freq
-                positional[i][ch] = positional[i].get(ch, 0) + freq
+            row = per_position[pos]
+            positional[pos] = {
+                chr(ord('a') + code): int(row[code])
+                for code in np.unique(codes[:, pos])
+            }
 
         return overall, positional
 
@@ -171,50 +313,101 @@ class WordleSolver:
         """
         Finds words that can be formed from the set of remaining (unused) letters.
         """
-        available_letters = set("abcdefghijklmnopqrstuvwxyz") - used_letters - not_allowed_letters
-        available_mask = self._get_word_mask("".join(available_letters))
-        
+        # A word qualifies iff it avoids every used/disallowed letter, so the
+        # mask of those letters is all we need - no alphabet set arithmetic.
+        unavailable = 0
+        for letter in used_letters:
+            unavailable |= self._get_char_mask(letter)
+        for letter in not_allowed_letters:
+            unavailable |= self._get_char_mask(letter)
+        banned_mask = np.uint32(unavailable)
+
+        scores26 = np.zeros(26, dtype=np.int64)
+        for letter, value in overall_distribution.items():
+            scores26[ord(letter) - ord('a')] = value
+
+        if word_length is not None:
+            tables = [self.by_length[word_length]] if word_length in self.by_length else []
+        else:
+            tables = list(self.by_length.values())
+
         valid_words: List[Tuple[str, int]] = []
-        for word_data in self.word_data_list:
-            word = word_data["word"]
-            frequency = word_data["freq"]
-            word_mask = word_data["mask"]
-            
-            if word_length is not None and len(word) != word_length:
-                continue
+        for table in tables:
+            # The tables are frequency-sorted, so the minimum-frequency
+            # constraint is a prefix found by bisection rather than a scan.
+            masks: np.ndarray = table["masks"]
+            if min_frequency:
+                cut = int(np.searchsorted(-table["freqs"], -min_frequency, side="right"))
+                if cut == 0:
+                    continue
+                masks = masks[:cut]
 
-            if frequency < min_frequency:
+            # Vectorized eligibility: subset-of-available-letters via the bitmasks
+            keep = (masks & banned_mask) == 0
+            idx = np.nonzero(keep)[0]
+            if idx.size == 0:
                 continue
-            
-            if (word_mask & available_mask) == word_mask:
-                score = sum(overall_distribution.get(letter, 0) for letter in set(word))
-                valid_words.append((word, score))
-                
-        valid_words.sort(key=lambda x: x[1], reverse=True)
+
+            # Score each word as the sum of the distribution over its unique
+            # letters: 26 masked vector adds instead of a set() per word.
+            sub_masks = masks[idx]
+            scores = np.zeros(idx.size, dtype=np.int64)
+            for bit in range(26):
+                if scores26[bit]:
+                    scores += scores26[bit] * ((sub_masks >> np.uint32(bit)) & np.uint32(1))
+
+            words: List[str] = table["words"]
+            valid_words.extend(
+                (words[i], int(s)) for i, s in zip(idx.tolist(), scores.tolist())
+            )
+
+        valid_words.sort(key=itemgetter(1), reverse=True)
         return valid_words
 
     def _score_coverage(self, word: str, overall_distribution: Distribution) -> int:
-        """Sum of letter frequencies for all letters in the word."""
+        """Sum of letter frequencies for all letters in the (lowercase) word."""
         return sum(overall_distribution.get(ch, 0)
-                   for ch in word.lower())
+                   for ch in word)
+
+    def _pattern_id_matrix(self, pool: List[str], word_length: int, answers_codes: np.ndarray) -> np.ndarray:
+        """
+        Pattern-id matrix of a candidate pool guessed against itself,
+        memoized per pool. Building the matrix dominates entropy scoring and
+        the GUI tends to ask about the same surviving pool repeatedly, so a
+        full whole-dictionary table on disk is unnecessary (and far too large
+        for this word list).
+        """
+        key = (word_length, tuple(pool))
+        cached = self._matrix_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if _fill_pattern_matrix_nb is not None:
+            matrix = _fill_pattern_matrix_nb(answers_codes, answers_codes)
+        else:
+            matrix = np.stack([feedback_pattern_ids(w, answers_codes) for w in pool])
+
+        if len(self._matrix_cache) >= 8:
+            self._matrix_cache.clear()
+        self._matrix_cache[key] = matrix
+        return matrix
 
     def _score_weighted_entropy(self, guess: str, possible_words: Results) -> float:
         """Entropy where each answer is weighted by its frequency."""
-        total_mass = sum(freq for _, freq in possible_words)
-        if not total_mass:
+        if not possible_words:
             return 0.0
-            
-        pattern_cnt: Counter[str] = Counter()
 
-        for answer, freq in possible_words:
-            pat = get_feedback_pattern(guess, answer)
-            pattern_cnt[pat] += freq
+        answers_codes = encode_words([w for w, _ in possible_words], len(guess))
+        freqs = np.fromiter((f for _, f in possible_words), np.float64, count=len(possible_words))
+        return self._entropy_for_guess(guess, answers_codes, freqs, float(freqs.sum()))
 
-        ent = 0.0
-        for mass in pattern_cnt.values():
-            p = mass / total_mass
-            ent -= p * math.log2(p)
-        return ent
+    def _entropy_for_guess(self, guess: str, answers_codes: np.ndarray, freqs: np.ndarray, total_mass: float) -> float:
+        """Weighted entropy of `guess` against pre-encoded answers."""
+        if not total_mass:
+            return 0.0
+        mass = np.bincount(feedback_pattern_ids(guess, answers_codes), weights=freqs)
+        p = mass[mass > 0] / total_mass
+        return float(-(p * np.log2(p)).sum())
 
     def best_guesses(self, possible_words: Results, overall_distribution: Distribution, cutoff: Optional[int] = 250, top_n: int = 15, min_frequency: int = 0) -> List[Tuple[str, float]]:
         """
@@ -223,46 +416,358 @@ class WordleSolver:
         if not possible_words:
             return []
 
+        # Endgame shortcut: with two or fewer candidates left, no probe can
+        # beat simply guessing one of them, so skip the scorers entirely.
+        if len(possible_words) <= 2:
+            return [(w, 0.0) for w, _ in possible_words[:top_n]]
+
         word_length = len(possible_words[0][0])
         possible_words_only = [w for w, _ in possible_words]
 
+        # Memoize finished results for small pools; the UI asks about the
+        # same surviving set repeatedly. Large pools are skipped so the
+        # cache never holds 100k-tuple keys (the coverage memo covers them).
+        best_key = None
+        if len(possible_words) <= _MATRIX_POOL_LIMIT:
+            best_key = (tuple(possible_words), cutoff, top_n, min_frequency)
+            cached_best = self._best_cache.get(best_key)
+            if cached_best is not None:
+                return cached_best
+
         if cutoff is None or len(possible_words) <= cutoff:
-            scorer = lambda w: self._score_weighted_entropy(w, possible_words)
-            pool: List[str] = possible_words_only
-        else:
-            scorer = lambda w: self._score_coverage(w, overall_distribution)
-            pool = [
-                d['word'] for d in self.word_data_list
-                if len(d['word']) == word_length and d['freq'] >= min_frequency
-            ]
+            # Encode the answer pool once; every guess is then scored against
+            # the same arrays instead of re-walking the list of tuples.
+            answers_codes = encode_words(possible_words_only, word_length)
+            freqs = np.fromiter((f for _, f in possible_words), np.float64, count=len(possible_words))
+            if len(possible_words) <= _MATRIX_POOL_LIMIT and 3 ** word_length <= 65536:
+                # Memoized pool-vs-pool pattern matrix; entropy is then one
+                # weighted bincount per row.
+                matrix = self._pattern_id_matrix(possible_words_only, word_length, answers_codes)
+                ent = entropies_from_pattern_matrix(matrix, freqs)
+            else:
+                total_mass = float(freqs.sum())
+                ent = np.fromiter(
+                    (self._entropy_for_guess(w, answers_codes, freqs, total_mass)
+                     for w in possible_words_only),
+                    np.float64, count=len(possible_words_only),
+                )
+            return self._remember_best(best_key, _top_scores(possible_words_only, ent, top_n))
+
+        cache_key = (word_length, min_frequency, tuple(sorted(overall_distribution.items())))
+        cached = self._coverage_cache.get(cache_key)
+        if cached is not None and cached[0] >= top_n:
+            return cached[1][:top_n]
+        table = self.by_length.get(word_length)
+        if table is None:
+            return []
+        # The table is frequency-sorted, so the min-frequency cutoff is a
+        # prefix; coverage scores are then one gather + row sum.
+        freqs_desc: np.ndarray = table["freqs"]
+        cut = int(np.searchsorted(-freqs_desc, -min_frequency, side="right"))
+        scores26 = np.zeros(26, dtype=np.int64)
+        for letter, value in overall_distribution.items():
+            scores26[ord(letter) - ord('a')] = value
+        coverage = scores26[table["codes"][:cut]].sum(axis=1)
+        top = _top_scores(table["words"][:cut], coverage, top_n)
+        if len(self._coverage_cache) >= 64:
+            self._coverage_cache.clear()
+        self._coverage_cache[cache_key] = (top_n, top)
+        return self._remember_best(best_key, top)
+
+    def _remember_best(self, best_key: Any, result: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
+        """Stores a finished best_guesses result under its pool key, if any."""
+        if best_key is not None:
+            if len(self._best_cache) >= 32:
+                self._best_cache.clear()
+            self._best_cache[best_key] = result
+        return result
+
+def _parse_word_list_bytes(data: bytes) -> Optional[Dict[int, Tuple[List[str], np.ndarray, np.ndarray]]]:
+    """
+    Vectorized parse of a word list whose every line is "letters,digits".
+    Returns {length: (words, codes, freqs)} sorted by descending frequency,
+    or None when the bytes do not match that layout (the caller then falls
+    back to the tolerant per-line parse).
+    """
+    if not data:
+        return {}
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    buf = np.frombuffer(data, dtype=np.uint8)
+
+    newlines = np.flatnonzero(buf == ord('\n'))
+    commas = np.flatnonzero(buf == ord(','))
+    if commas.size != newlines.size or (buf == ord('\r')).any():
+        return None
+    starts = np.empty(newlines.size, dtype=np.int64)
+    starts[0] = 0
+    starts[1:] = newlines[:-1] + 1
+    if not ((commas > starts).all() and (commas < newlines).all()):
+        return None
+
+    word_lens = commas - starts
+    digit_lens = newlines - commas - 1
+    if not (digit_lens > 0).all():
+        return None
+
+    # Horner pass over the digit columns; rows shorter than the current
+    # column are left untouched.
+    freqs = np.zeros(newlines.size, dtype=np.int64)
+    for col in range(int(digit_lens.max())):
+        in_row = digit_lens > col
+        digits = buf[commas[in_row] + 1 + col].astype(np.int64) - ord('0')
+        if (digits < 0).any() or (digits > 9).any():
+            return None
+        freqs[in_row] = freqs[in_row] * 10 + digits
+
+    out: Dict[int, Tuple[List[str], np.ndarray, np.ndarray]] = {}
+    for length in np.unique(word_lens):
+        length = int(length)
+        sel = word_lens == length
+        gather = starts[sel][:, None] + np.arange(length)
+        codes = (buf[gather] | np.uint8(0x20)) - np.uint8(ord('a'))  # folds A-Z onto a-z
+        if codes.max() > 25:
+            return None  # non-letter bytes wrap far past 'z' in uint8
+        order = np.argsort(-freqs[sel], kind="stable")
+        codes = np.ascontiguousarray(codes[order])
+        words = np.frombuffer(
+            (codes + np.uint8(ord('a'))).tobytes(), dtype=f"S{length}"
+        ).astype(str).tolist()
+        out[length] = (words, codes, freqs[sel][order])
+    return out
+
+
+def _top_scores(words: List[str], scores: np.ndarray, top_n: int) -> List[Tuple[str, Any]]:
+    """
+    Top-N (word, score) pairs by descending score. Uses argpartition so a
+    large pool is selected in O(N) and only the kept slice is sorted.
+    """
+    n = len(words)
+    if n > top_n:
+        idx = np.argpartition(scores, n - top_n)[n - top_n:]
+        idx = idx[np.argsort(-scores[idx])]
+    else:
+        idx = np.argsort(-scores)
+    return [(words[i], scores[i].item()) for i in idx]
 
-        scores = [(w, scorer(w)) for w in pool]
-        scores.sort(key=lambda x: x[1], reverse=True)
-        
-        return scores[:top_n]
 
 # Keep top-level functions that are pure helpers and don't depend on solver state
-def get_feedback_pattern(guess: str, answer: str) -> str:
+def encode_word(word: str) -> np.ndarray:
+    """Encodes one lowercase word as a uint8 array of letter codes (0-25)."""
+    return np.frombuffer(word.encode("ascii"), dtype=np.uint8) - ord('a')
+
+
+def encode_words(words: List[str], word_length: int) -> np.ndarray:
     """
-    Returns a 5-char string such as 'GYBBY' (G=green, Y=yellow, B=gray).
-    Handles duplicate letters correctly.
+    Encodes equal-length lowercase words into a (N, word_length) uint8 array
+    of letter codes in the range 0-25.
+    """
+    buf = "".join(words).encode("ascii")
+    return (np.frombuffer(buf, dtype=np.uint8) - ord('a')).reshape(len(words), word_length)
+
+
+def pattern_to_id(pattern: str) -> int:
+    """Converts a 'GYB' feedback string to its base-3 integer id."""
+    pid = 0
+    for ch in pattern:
+        pid = pid * 3 + {"B": 0, "Y": 1, "G": 2}[ch]
+    return pid
+
+
+def feedback_pattern_ids(guess: str, answers_codes: np.ndarray) -> np.ndarray:
+    """
+    Computes the feedback pattern of `guess` against every answer at once.
+
+    `answers_codes` is a (N, L) uint8 array of letter codes (see `encode_words`).
+    Returns a uint16 array of base-3 pattern ids (trits: B=0, Y=1, G=2, first
+    position most significant) matching `get_feedback_pattern` pair by pair.
+    Only the inexpensive loops over the L positions stay in Python; everything
+    over the N answers is vectorized.
+    """
+    g = encode_word(guess.lower())
+    n, length = answers_codes.shape
+
+    green = answers_codes == g  # (N, L) bool
+
+    # Per-answer letter counts, minus the letters consumed by green matches.
+    counts = np.zeros((n, 26), dtype=np.int16)
+    rows = np.arange(n)
+    for i in range(length):
+        counts[rows, answers_codes[:, i]] += 1
+    for i in range(length):
+        gi = green[:, i]
+        counts[gi, g[i]] -= 1
+
+    trits = green.astype(np.uint16) * 2
+    for i in range(length):
+        yellow = ~green[:, i] & (counts[:, g[i]] > 0)
+        trits[yellow, i] = 1
+        counts[yellow, g[i]] -= 1
+
+    # int64 accumulation: 3**length outgrows uint16 at 11 letters, and this
+    # batch path is what long-word pools fall back to.
+    pids = np.zeros(n, dtype=np.int64)
+    for i in range(length):
+        pids = pids * 3 + trits[:, i]
+    return pids
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _feedback_id_nb(g: np.ndarray, a: np.ndarray) -> int:
+        """Base-3 pattern id for one (guess, answer) pair of uint8 code arrays."""
+        length = g.shape[0]
+        remaining = np.zeros(26, dtype=np.int16)
+        trits = np.zeros(length, dtype=np.uint8)
+        for i in range(length):
+            remaining[a[i]] += 1
+        for i in range(length):
+            if g[i] == a[i]:
+                trits[i] = 2
+                remaining[g[i]] -= 1
+        pid = 0
+        for i in range(length):
+            if trits[i] == 0 and remaining[g[i]] > 0:
+                trits[i] = 1
+                remaining[g[i]] -= 1
+            pid = pid * 3 + trits[i]
+        return pid
+
+    @njit(parallel=True, cache=True, nogil=True)
+    def _fill_pattern_matrix_nb(guess_codes: np.ndarray, answer_codes: np.ndarray) -> np.ndarray:
+        """
+        Base-3 pattern ids of every guess against every answer, as a
+        (n_guesses, n_answers) uint16 matrix. Both code arrays are (N, L)
+        uint8 with values 0-25; ids match `feedback_pattern_ids`.
+        """
+        n_guesses = guess_codes.shape[0]
+        n_answers, length = answer_codes.shape
+        out = np.empty((n_guesses, n_answers), dtype=np.uint16)
+
+        for gi in prange(n_guesses):
+            remaining = np.zeros(26, dtype=np.int16)
+            trits = np.zeros(length, dtype=np.uint8)
+            for ai in range(n_answers):
+                for i in range(length):
+                    remaining[answer_codes[ai, i]] += 1
+                for i in range(length):
+                    if guess_codes[gi, i] == answer_codes[ai, i]:
+                        trits[i] = 2
+                        remaining[guess_codes[gi, i]] -= 1
+                    else:
+                        trits[i] = 0
+                pid = 0
+                for i in range(length):
+                    if trits[i] == 0 and remaining[guess_codes[gi, i]] > 0:
+                        trits[i] = 1
+                        remaining[guess_codes[gi, i]] -= 1
+                    pid = pid * 3 + trits[i]
+                out[gi, ai] = pid
+                # Only this answer's letters were touched; clear them for the next one.
+                for i in range(length):
+                    remaining[answer_codes[ai, i]] = 0
+        return out
+else:
+    _feedback_id_nb = None
+    _fill_pattern_matrix_nb = None
+
+
+def entropies_from_pattern_matrix(matrix: np.ndarray, freqs: np.ndarray) -> np.ndarray:
+    """
+    Frequency-weighted entropy of each row of a pattern-id matrix.
+    Row g holds the pattern ids of guess g against every answer; `freqs`
+    weights the answers.
+    """
+    total = freqs.sum()
+    if total <= 0 or matrix.size == 0:
+        return np.zeros(matrix.shape[0], dtype=np.float64)
+
+    # One bincount per row keeps the working set at O(3^L) instead of the
+    # O(n_guesses * 3^L) a dense scatter-add would need — for long words
+    # that dense buffer runs to hundreds of megabytes.
+    n_guesses = matrix.shape[0]
+    n_patterns = int(matrix.max()) + 1
+    entropies = np.empty(n_guesses, dtype=np.float64)
+    for g in range(n_guesses):
+        masses = np.bincount(matrix[g], weights=freqs, minlength=n_patterns)
+        p = masses[masses > 0] / total
+        entropies[g] = -(p * np.log2(p)).sum()
+    return entropies
+
+
+def feedback_pattern_id(guess: str, answer: str) -> int:
+    """
+    Returns the base-3 integer id of the feedback pattern for a single
+    (guess, answer) pair. Trits are B=0, Y=1, G=2 with the first position
+    most significant, matching `feedback_pattern_ids`.
     """
     g = guess.lower()
     a = answer.lower()
-    pattern = ['B'] * len(g)
-    
-    answer_counts = Counter(a)
+
+    if _feedback_id_nb is not None and g.isascii() and a.isascii():
+        g_codes = encode_word(g)
+        a_codes = encode_word(a)
+        # The JIT kernel indexes 26-slot arrays, so only take it for pure a-z
+        # input (uint8 wraps anything else above 25).
+        if (g_codes < 26).all() and (a_codes < 26).all():
+            return int(_feedback_id_nb(g_codes, a_codes))
+
+    trits = [0] * len(g)
+
+    # Characters below 'a' (digits, punctuation) have no SWAR lane; count
+    # those inputs in a plain dict instead, like the old Counter did.
+    if min(map(ord, g + a), default=97) < 97:
+        counts_map: Dict[str, int] = {}
+        for ch in a:
+            counts_map[ch] = counts_map.get(ch, 0) + 1
+        for i, ch in enumerate(g):
+            if ch == a[i]:
+                trits[i] = 2
+                counts_map[ch] -= 1
+        pid = 0
+        for i, ch in enumerate(g):
+            if trits[i] == 0 and counts_map.get(ch, 0) > 0:
+                trits[i] = 1
+                counts_map[ch] -= 1
+            pid = pid * 3 + trits[i]
+        return pid
+
+    # SWAR letter multiset: one big int with an 8-bit count lane per letter
+    # (wide enough for heavily repeated letters), instead of a Counter.
+    counts = 0
+    for ch in a:
+        counts += 1 << ((ord(ch) - 97) << 3)
 
     # Pass 1: Find green letters
     for i, ch in enumerate(g):
         if ch == a[i]:
-            pattern[i] = 'G'
-            answer_counts[ch] -= 1
+            trits[i] = 2
+            counts -= 1 << ((ord(ch) - 97) << 3)
 
-    # Pass 2: Find yellow letters
+    # Pass 2: Find yellow letters and fold the trits into one id
+    pid = 0
     for i, ch in enumerate(g):
-        if pattern[i] == 'B' and answer_counts.get(ch, 0) > 0:
-            pattern[i] = 'Y'
-            answer_counts[ch] -= 1
-            
-    return "".join(pattern)
\ No newline at end of file
+        if trits[i] == 0:
+            shift = (ord(ch) - 97) << 3
+            if (counts >> shift) & 0xFF:
+                trits[i] = 1
+                counts -= 1 << shift
+        pid = pid * 3 + trits[i]
+    return pid
+
+
+def id_to_pattern(pid: int, length: int) -> str:
+    """Decodes a base-3 pattern id back into a 'GYB' string of `length` chars."""
+    chars = []
+    for _ in range(length):
+        pid, trit = divmod(pid, 3)
+        chars.append("BYG"[trit])
+    return "".join(reversed(chars))
+
+
+def get_feedback_pattern(guess: str, answer: str) -> str:
+    """
+    Returns a 5-char string such as 'GYBBY' (G=green, Y=yellow, B=gray).
+    Handles duplicate letters correctly.
+    """
+    return id_to_pattern(feedback_pattern_id(guess, answer), len(guess))
\ No newline at end of file
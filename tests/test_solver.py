@@ -2,10 +2,19 @@ import unittest
 import sys
 import os
 
+import numpy as np
+
 # Add the parent directory to the path so we can import the solver
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from solver import WordleSolver, get_feedback_pattern
+import solver as solver_module
+from solver import (
+    WordleSolver,
+    encode_words,
+    feedback_pattern_ids,
+    get_feedback_pattern,
+    pattern_to_id,
+)
 
 class TestWordleSolver(unittest.TestCase):
     
@@ -24,8 +33,10 @@ class TestWordleSolver(unittest.TestCase):
         self.solver = WordleSolver("test_freq.txt")
 
     def tearDown(self):
-        """Clean up the dummy frequency file after each test."""
+        """Clean up the dummy frequency file and its parse cache after each test."""
         os.remove("test_freq.txt")
+        if os.path.exists("test_freq.npz"):
+            os.remove("test_freq.npz")
 
     def test_score_coverage_with_duplicates(self):
         """Test that _score_coverage correctly handles duplicate letters."""
@@ -57,6 +68,48 @@ class TestWordleSolver(unittest.TestCase):
         self.assertEqual(get_feedback_pattern("aaaaa", "bbbbb"), "BBBBB")
         self.assertEqual(get_feedback_pattern("abcde", "abcde"), "GGGGG")
         self.assertEqual(get_feedback_pattern("edcba", "abcde"), "YYGYY")
+        # Non-letter characters must fall back gracefully, not raise.
+        self.assertEqual(get_feedback_pattern("cra3e", "crane"), "GGGBG")
+
+    def test_feedback_pattern_ids_matches_scalar(self):
+        """The vectorized batch feedback must agree with get_feedback_pattern."""
+        answers = ["earth", "apply", "toast", "world", "babac", "bbbbb", "abcde"]
+        answers_codes = encode_words(answers, 5)
+        for guess in ["crane", "apple", "tests", "hello", "aabbc", "aaaaa", "edcba"]:
+            ids = feedback_pattern_ids(guess, answers_codes)
+            expected = [pattern_to_id(get_feedback_pattern(guess, a)) for a in answers]
+            self.assertEqual(list(ids), expected)
+
+    def test_feedback_pattern_ids_long_words(self):
+        """Ids for words of length >= 11 must not wrap (3**11 > uint16)."""
+        answers = ["established", "restoration", "electricity", "marketplace"]
+        answers_codes = encode_words(answers, 11)
+        for guess in ["established", "performance", "restoration"]:
+            ids = feedback_pattern_ids(guess, answers_codes)
+            expected = [pattern_to_id(get_feedback_pattern(guess, a)) for a in answers]
+            self.assertEqual(list(ids), expected)
+        # An all-green 11-letter pattern exceeds the old uint16 range.
+        self.assertEqual(int(feedback_pattern_ids("established", answers_codes)[0]), 3 ** 11 - 1)
+
+    def test_entropies_from_pattern_matrix(self):
+        """Row-wise matrix entropies must agree with the per-guess scorer."""
+        words = ["crane", "earth", "react", "eerie", "apple"]
+        freqs = [110.0, 120.0, 130.0, 70.0, 100.0]
+        possible = list(zip(words, freqs))
+        codes = encode_words(words, 5)
+        matrix = np.stack([feedback_pattern_ids(w, codes) for w in words])
+        ent = solver_module.entropies_from_pattern_matrix(matrix, np.array(freqs))
+        for i, word in enumerate(words):
+            self.assertAlmostEqual(ent[i], self.solver._score_weighted_entropy(word, possible))
+
+    @unittest.skipIf(solver_module._fill_pattern_matrix_nb is None, "numba not installed")
+    def test_numba_pattern_matrix_matches_numpy(self):
+        """The parallel numba matrix fill must agree with the NumPy batch path."""
+        words = ["crane", "earth", "react", "eerie", "apple", "aabbc"]
+        codes = encode_words(words, 5)
+        matrix_nb = solver_module._fill_pattern_matrix_nb(codes, codes)
+        matrix_np = np.stack([feedback_pattern_ids(w, codes) for w in words])
+        self.assertTrue((matrix_nb == matrix_np).all())
 
     def test_parse_misplaced_letters(self):
         """Test the parsing of the misplaced letters string."""
@@ -68,6 +121,34 @@ class TestWordleSolver(unittest.TestCase):
         self.assertEqual(self.solver.parse_misplaced_letters("a:1,foo,3"), {'a': {0, 2}})
         self.assertEqual(self.solver.parse_misplaced_letters("a:1;a:3"), {'a': {0, 2}})
 
+    def test_npz_cache_roundtrip(self):
+        """A second solver on the same file must load the cache and agree."""
+        self.assertTrue(os.path.exists("test_freq.npz"))
+        cached = WordleSolver("test_freq.txt")
+        self.assertEqual(
+            cached.filter_words(5, "_____", "", ""),
+            self.solver.filter_words(5, "_____", "", ""),
+        )
+
+    def test_corrupt_cache_is_ignored(self):
+        """A garbage .npz must be rebuilt from the text file, not crash."""
+        with open("test_freq.npz", "wb") as f:
+            f.write(b"this is not a zip archive")
+        recovered = WordleSolver("test_freq.txt")
+        self.assertEqual(
+            recovered.filter_words(5, "_____", "", ""),
+            self.solver.filter_words(5, "_____", "", ""),
+        )
+
+    def test_find_words_from_remaining_letters(self):
+        """Only words built entirely from unused letters should be returned."""
+        distribution = {'e': 5, 'i': 2, 'r': 1, 'z': 9}
+        results = self.solver.find_words_from_remaining_letters(
+            {'a'}, {'b'}, distribution, word_length=5
+        )
+        # Every other test word contains 'a' or 'b'; "eerie" scores e+i+r once each.
+        self.assertEqual(results, [("eerie", 8)])
+
     def test_filter_words(self):
         """Test the main word filtering logic."""
         # Pattern filtering